@@ -488,8 +488,11 @@ class AdminCog(commands.Cog):
             timestamp=datetime.datetime.now()
         )
 
+        # Fetch everyone's stats in one go so missing ones are initialized with a single config save
+        all_stats = chores_cog.config_manager.get_all_flatmate_stats()
+
         for flatmate in flatmates:
-            stats = chores_cog.config_manager.get_flatmate_stats(flatmate["name"])
+            stats = all_stats.get(flatmate["name"])
             if not stats:
                 logger.warning(f"No stats found for flatmate: {flatmate['name']}")
                 continue
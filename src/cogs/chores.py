@@ -20,8 +20,14 @@ class ChoresCog(commands.Cog):
         self.config_manager = ConfigManager()
         self.schedule_manager = ScheduleManager(self.config_manager)
 
-        # Cache message IDs for reactions (maps message_id -> (chore, flatmate_name))
-        self.message_cache = {}
+        # The emoji configuration doesn't change at runtime, so resolve the reaction emojis once
+        emojis = self.config_manager.get_emoji()
+        self._emoji_completed = emojis["completed"]
+        self._emoji_unavailable = emojis["unavailable"]
+
+        # Cache message IDs for reactions, as parallel maps message_id -> chore and message_id -> flatmate_name
+        self.msg_chore = {}
+        self.msg_assignee = {}
 
         # Cache for difficulty voting messages (maps message_id -> chore_name)
         self.difficulty_vote_cache = {}
@@ -34,6 +40,26 @@ class ChoresCog(commands.Cog):
         self.instructions_sent = False
         logger.debug("ChoresCog initialized successfully")
 
+    async def cog_unload(self):
+        """Write any pending schedule data before the cog goes away."""
+        logger.info("Unloading ChoresCog, flushing schedule data")
+        await asyncio.to_thread(self.schedule_manager.close)
+
+    def _cache_message(self, message_id, chore, flatmate_name):
+        """Track an assignment message so reactions to it can be handled."""
+        self.msg_chore[message_id] = chore
+        self.msg_assignee[message_id] = flatmate_name
+
+    def _cache_pop(self, message_id):
+        """Stop tracking an assignment message."""
+        self.msg_chore.pop(message_id, None)
+        self.msg_assignee.pop(message_id, None)
+
+    def _cache_clear(self):
+        """Forget every tracked assignment message."""
+        self.msg_chore = {}
+        self.msg_assignee = {}
+
     def cog_check(self, ctx):
         """Check if the command is being used in the chores channel."""
         logger.debug(
@@ -101,7 +127,7 @@ class ChoresCog(commands.Cog):
                 msg_count += 1
 
                 # Cache the message ID for reaction handling
-                self.message_cache[message.id] = (chore, flatmate_name)
+                self._cache_message(message.id, chore, flatmate_name)
 
             logger.info(f"Posted detailed schedule with {msg_count} individual messages")
 
@@ -128,12 +154,18 @@ class ChoresCog(commands.Cog):
         """Reset the chore rotation."""
         logger.info(f"Reset schedule command invoked by {interaction.user.name} (ID: {interaction.user.id})")
 
+        # Acknowledge right away: flushing waits out the save debounce, which would eat into
+        # the few seconds Discord allows for the first response
+        await interaction.response.defer()
+
         success, message = self.schedule_manager.reset_schedule()
-        await interaction.response.send_message(message)
+        # Make sure the cleared schedule is on disk before confirming the reset
+        await asyncio.to_thread(self.schedule_manager.flush)
+        await interaction.followup.send(message)
 
         # Reset the message cache and instructions flag
         logger.debug("Resetting message cache and instructions flag")
-        self.message_cache = {}
+        self._cache_clear()
         self.instructions_sent = False
         logger.info("Schedule reset successfully")
 
@@ -195,7 +227,7 @@ class ChoresCog(commands.Cog):
         # Add next week exclusions
         excluded_flatmates = self.schedule_manager.get_excluded_for_next_rotation()
         if excluded_flatmates:
-            exclusions_str = "\n".join([f"• {name}" for name in excluded_flatmates])
+            exclusions_str = "\n".join([f"• {name}" for name in sorted(excluded_flatmates)])
             embed.add_field(
                 name="Excluded from Next Rotation",
                 value=exclusions_str,
@@ -353,7 +385,10 @@ class ChoresCog(commands.Cog):
 
         embed.add_field(
             name="Performance",
-            value=BotStrings.STATS_COMPLETION_RATE.format(rate=completion_rate),
+            value=BotStrings.STATS_COMPLETION_RATE.format(
+                rate=completion_rate,
+                verdict=BotStrings.STATS_RATE_GOOD if completion_rate > 80 else BotStrings.STATS_RATE_LOW
+            ),
             inline=False
         )
 
@@ -436,20 +471,20 @@ class ChoresCog(commands.Cog):
             vote_counts = {i: 0 for i in range(1, 6)}
             logger.debug("Counting votes")
 
+            # Map each rating emoji to its difficulty once instead of rescanning them per reaction
+            difficulty_for_emoji = {emojis[f"difficulty_{i}"]: i for i in range(1, 6)}
+
             for reaction in updated_message.reactions:
                 # Skip reactions that aren't difficulty ratings
-                if str(reaction.emoji) not in [emojis[f"difficulty_{i}"] for i in range(1, 6)]:
+                i = difficulty_for_emoji.get(str(reaction.emoji))
+                if i is None:
                     logger.debug(f"Skipping non-difficulty reaction: {reaction.emoji}")
                     continue
 
-                # Figure out which difficulty this reaction represents
-                for i in range(1, 6):
-                    if str(reaction.emoji) == emojis[f"difficulty_{i}"]:
-                        # Count non-bot votes
-                        users = [user async for user in reaction.users() if not user.bot]
-                        vote_counts[i] = len(users)
-                        logger.debug(f"Difficulty {i} received {vote_counts[i]} votes")
-                        break
+                # Count non-bot votes
+                users = [user async for user in reaction.users() if not user.bot]
+                vote_counts[i] = len(users)
+                logger.debug(f"Difficulty {i} received {vote_counts[i]} votes")
 
             # Calculate the average difficulty (weighted average)
             total_votes = sum(vote_counts.values())
@@ -619,14 +654,16 @@ class ChoresCog(commands.Cog):
 
         # Generate new schedule
         logger.debug("Generating new schedule")
-        assignments = self.schedule_manager.generate_new_schedule()
-        if not assignments:
-            logger.warning("Failed to generate schedule: No assignments created")
-            return
+        # Both steps rewrite the whole schedule, so batch them into a single save
+        with self.schedule_manager:
+            assignments = self.schedule_manager.generate_new_schedule()
+            if not assignments:
+                logger.warning("Failed to generate schedule: No assignments created")
+                return
 
-        # Update last posted date
-        logger.debug("Updating last posted date")
-        self.schedule_manager.update_last_posted_date()
+            # Update last posted date
+            logger.debug("Updating last posted date")
+            self.schedule_manager.update_last_posted_date()
 
         # Get the chores channel if not provided
         if channel is None:
@@ -651,8 +688,8 @@ class ChoresCog(commands.Cog):
             logger.debug("Instructions already sent")
 
         # Clear previous message cache
-        old_cache_size = len(self.message_cache)
-        self.message_cache = {}
+        old_cache_size = len(self.msg_chore)
+        self._cache_clear()
         logger.debug(f"Cleared previous message cache ({old_cache_size} entries)")
 
         # Send individual messages for each assignment
@@ -685,7 +722,7 @@ class ChoresCog(commands.Cog):
             logger.debug(f"Added reactions to message {message.id}: {emojis['completed']} and {emojis['unavailable']}")
 
             # Cache the message ID for reaction handling
-            self.message_cache[message.id] = (chore, flatmate_name)
+            self._cache_message(message.id, chore, flatmate_name)
             logger.debug(f"Cached message ID {message.id} for chore '{chore}' assigned to {flatmate_name}")
 
         logger.info(f"Posted new schedule in channel {channel.name} ({channel.id}) with {len(assignments)} assignments")
@@ -805,7 +842,7 @@ class ChoresCog(commands.Cog):
             return
 
         # Check if this is a reaction to one of our tracked messages
-        if payload.message_id in self.message_cache:
+        if payload.message_id in self.msg_chore:
             logger.info(f"Detected reaction to tracked chore message: {payload.message_id}")
             await self._handle_chore_reaction(payload)
         elif payload.message_id in self.difficulty_vote_cache:
@@ -823,56 +860,57 @@ class ChoresCog(commands.Cog):
 
     async def _handle_chore_reaction(self, payload):
         """Handle reactions to chore assignment messages."""
-        logger.info(f"Handling chore reaction from user ID: {payload.user_id}, emoji: {payload.emoji}")
+        logger.info("Handling chore reaction from user ID: %s, emoji: %s", payload.user_id, payload.emoji)
 
         # Get the channel
         channel = self.bot.get_channel(payload.channel_id)
         if not channel:
-            logger.error(f"Channel not found: {payload.channel_id}")
+            logger.error("Channel not found: %s", payload.channel_id)
             return
 
         # Get the message
         try:
-            logger.debug(f"Fetching message: {payload.message_id}")
+            logger.debug("Fetching message: %s", payload.message_id)
             message = await channel.fetch_message(payload.message_id)
             if not message:
-                logger.warning(f"Message not found: {payload.message_id}")
+                logger.warning("Message not found: %s", payload.message_id)
                 return
         except discord.errors.NotFound:
-            logger.error(f"Message {payload.message_id} not found, possibly deleted")
+            logger.error("Message %s not found, possibly deleted", payload.message_id)
             return
         except Exception as e:
-            logger.error(f"Failed to fetch message: {e}", exc_info=True)
+            logger.error("Failed to fetch message: %s", e, exc_info=True)
             return
 
         # Get the user who reacted
         user = self.bot.get_user(payload.user_id)
         if not user:
-            logger.warning(f"User not found: {payload.user_id}")
+            logger.warning("User not found: %s", payload.user_id)
             return
 
         # Get the chore and assigned flatmate from our cache
-        chore, assigned_flatmate_name = self.message_cache[payload.message_id]
-        logger.debug(f"Cached assignment: chore '{chore}' assigned to {assigned_flatmate_name}")
+        chore = self.msg_chore[payload.message_id]
+        assigned_flatmate_name = self.msg_assignee[payload.message_id]
+        logger.debug("Cached assignment: chore '%s' assigned to %s", chore, assigned_flatmate_name)
 
         # Get the flatmate from the user's Discord ID
         flatmate = self.config_manager.get_flatmate_by_discord_id(payload.user_id)
         if not flatmate:
             # Remove reaction if the user is not a flatmate
-            logger.warning(f"User {user.name} (ID: {payload.user_id}) is not a flatmate, removing reaction")
+            logger.warning("User %s (ID: %s) is not a flatmate, removing reaction", user.name, payload.user_id)
             await message.remove_reaction(payload.emoji, user)
             return
 
-        # Get the emoji configuration
-        emojis = self.config_manager.get_emoji()
+        emoji_completed = self._emoji_completed
+        emoji_unavailable = self._emoji_unavailable
         emoji_name = str(payload.emoji)
-        logger.debug(f"Reaction emoji: {emoji_name}")
+        logger.debug("Reaction emoji: %s", emoji_name)
 
         # Check if this is the assigned flatmate or someone else helping out
         is_assigned_flatmate = flatmate["name"] == assigned_flatmate_name
 
         # Handle the reaction based on the emoji
-        if emoji_name == emojis["completed"]:
+        if emoji_name == emoji_completed:
             # Check if the chore is still in pending chores
             pending_chores = self.schedule_manager.get_pending_chores()
             is_pending = chore in pending_chores
@@ -883,7 +921,7 @@ class ChoresCog(commands.Cog):
 
             # If the chore is not pending, and this person already completed it, ignore
             if not is_pending and has_already_completed:
-                logger.debug(f"Flatmate {flatmate['name']} has already completed this chore, ignoring")
+                logger.debug("Flatmate %s has already completed this chore, ignoring", flatmate['name'])
                 await message.remove_reaction(payload.emoji, user)
                 await channel.send(
                     f"{user.mention} You've already completed this chore.",
@@ -893,7 +931,7 @@ class ChoresCog(commands.Cog):
 
             if is_assigned_flatmate:
                 # Mark chore as completed by assigned flatmate
-                logger.info(f"Marking chore '{chore}' as completed by {flatmate['name']}")
+                logger.info("Marking chore '%s' as completed by %s", chore, flatmate['name'])
                 success, message_text = self.schedule_manager.mark_chore_completed(chore, flatmate["name"])
 
                 if success:
@@ -903,7 +941,7 @@ class ChoresCog(commands.Cog):
                         chore=chore
                     )
                     await channel.send(completion_msg)
-                    logger.info(f"Chore '{chore}' marked as completed by {flatmate['name']}")
+                    logger.info("Chore '%s' marked as completed by %s", chore, flatmate['name'])
 
                     # Play celebration music
                     music_cog = self.bot.get_cog("MusicCog")
@@ -914,7 +952,7 @@ class ChoresCog(commands.Cog):
                         logger.warning("MusicCog not found, cannot play celebration music")
             else:
                 # Another flatmate is completing the chore
-                logger.info(f"Flatmate {flatmate['name']} is completing chore '{chore}'")
+                logger.info("Flatmate %s is completing chore '%s'", flatmate['name'], chore)
 
                 # Mark chore as completed with helper
                 success, message_text = self.schedule_manager.mark_chore_completed(
@@ -935,7 +973,7 @@ class ChoresCog(commands.Cog):
                         helper_msg = f"✅ {user.mention} has completed the chore **{chore}** that was assigned to {assigned_mention}! Thank you so much for participating in keeping our flat clean! 🦸"
 
                     await channel.send(helper_msg)
-                    logger.info(f"Chore '{chore}' completed by {flatmate['name']} for {assigned_flatmate_name}")
+                    logger.info("Chore '%s' completed by %s for %s", chore, flatmate['name'], assigned_flatmate_name)
 
                     # Play celebration music
                     music_cog = self.bot.get_cog("MusicCog")
@@ -944,10 +982,10 @@ class ChoresCog(commands.Cog):
                         await music_cog.play_celebration(channel.guild)
                     else:
                         logger.warning("MusicCog not found, cannot play celebration music")
-        elif emoji_name == emojis["unavailable"]:
+        elif emoji_name == emoji_unavailable:
             # Only the assigned flatmate can mark as unavailable
             if not is_assigned_flatmate:
-                logger.warning(f"User {user.name} tried to mark someone else's chore as unavailable")
+                logger.warning("User %s tried to mark someone else's chore as unavailable", user.name)
                 await message.remove_reaction(payload.emoji, user)
                 await channel.send(
                     f"{user.mention} You can only mark your own assigned chores as unavailable.",
@@ -956,11 +994,11 @@ class ChoresCog(commands.Cog):
                 return
 
             # Mark the original flatmate as having voted
-            logger.info(f"Marking flatmate {flatmate['name']} as unavailable for chore '{chore}'")
+            logger.info("Marking flatmate %s as unavailable for chore '%s'", flatmate['name'], chore)
             self.schedule_manager.add_voted_flatmate(flatmate["name"])
 
             # Randomly reassign the chore
-            logger.debug(f"Randomly reassigning chore '{chore}' from {flatmate['name']}")
+            logger.debug("Randomly reassigning chore '%s' from %s", chore, flatmate['name'])
             next_flatmate_name = self.schedule_manager.randomly_reassign_chore(
                 chore,
                 flatmate["name"]
@@ -972,7 +1010,7 @@ class ChoresCog(commands.Cog):
 
                 if next_flatmate:
                     next_discord_id = next_flatmate["discord_id"]
-                    logger.debug(f"Chore reassigned to {next_flatmate_name} (ID: {next_discord_id})")
+                    logger.debug("Chore reassigned to %s (ID: %s)", next_flatmate_name, next_discord_id)
 
                     # Send reassignment notification
                     reassign_msg = BotStrings.TASK_REASSIGNED_FULL.format(
@@ -988,29 +1026,29 @@ class ChoresCog(commands.Cog):
                         chore=chore
                     )
                     new_message = await channel.send(new_task_msg)
-                    logger.debug(f"Created new assignment message, ID: {new_message.id}")
+                    logger.debug("Created new assignment message, ID: %s", new_message.id)
 
-                    # Add reactions to the new message
-                    await new_message.add_reaction(emojis["completed"])
-                    await new_message.add_reaction(emojis["unavailable"])
-                    logger.debug(f"Added reactions to new message {new_message.id}")
+                    # Add reactions to the new message one after the other so they always appear in this order
+                    await new_message.add_reaction(emoji_completed)
+                    await new_message.add_reaction(emoji_unavailable)
+                    logger.debug("Added reactions to new message %s", new_message.id)
 
                     # Update our message cache
-                    self.message_cache[new_message.id] = (chore, next_flatmate_name)
-                    logger.debug(f"Cached new message ID {new_message.id} for reassigned chore")
+                    self._cache_message(new_message.id, chore, next_flatmate_name)
+                    logger.debug("Cached new message ID %s for reassigned chore", new_message.id)
 
                     # Remove the old message from the cache
-                    self.message_cache.pop(payload.message_id, None)
-                    logger.debug(f"Removed old message ID {payload.message_id} from cache")
+                    self._cache_pop(payload.message_id)
+                    logger.debug("Removed old message ID %s from cache", payload.message_id)
 
                     logger.info(
-                        f"Chore '{chore}' successfully reassigned from {flatmate['name']} to {next_flatmate_name}")
+                        "Chore '%s' successfully reassigned from %s to %s", chore, flatmate['name'], next_flatmate_name)
             else:
-                logger.warning(f"Failed to reassign chore '{chore}'")
+                logger.warning("Failed to reassign chore '%s'", chore)
                 await channel.send(BotStrings.ERR_REASSIGN_FAILED.format(chore=chore))
         else:
             # Remove unrelated reactions
-            logger.debug(f"Removing unrelated reaction {emoji_name} from message {payload.message_id}")
+            logger.debug("Removing unrelated reaction %s from message %s", emoji_name, payload.message_id)
             await message.remove_reaction(payload.emoji, user)
 
     async def _handle_next_week_planning_reaction(self, payload):
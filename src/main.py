@@ -2,6 +2,7 @@ import asyncio
 import datetime
 import json
 import logging
+import signal
 from pathlib import Path
 
 import discord
@@ -348,10 +349,19 @@ async def main():
     global bot
     bot = ChoresBot(config)
 
-    # Run the bot with the token from config
+    # docker stop sends SIGTERM; cancel the bot like Ctrl-C does so it still shuts down cleanly
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:  # Windows event loops don't support signal handlers
+        pass
+
+    # Run the bot with the token from config; leaving the block closes it, which unloads the cogs
     logger.info("Starting bot...")
     try:
-        await bot.start(config["token"])
+        async with bot:
+            await bot.start(config["token"])
+    except asyncio.CancelledError:
+        logger.info("Bot stopped")
     except discord.LoginFailure:
         logger.critical("Invalid bot token. Please check your configuration.")
     except Exception as e:
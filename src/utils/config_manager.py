@@ -11,6 +11,10 @@ class ConfigManager:
         logger.info(f"Initializing ConfigManager with config path: {config_path}")
         self.config_path = config_path
         self.config = self._load_config()
+        # Bumped whenever the flatmate list or a vacation flag changes; invalidates the flatmate caches below
+        self._flatmates_version = 0
+        self._active_flatmates_cache = None
+        self._flatmate_index_cache = None
         logger.debug("ConfigManager initialized successfully")
 
     def _load_config(self):
@@ -85,30 +89,59 @@ class ConfigManager:
         return flatmates
 
     def get_active_flatmates(self):
-        """Get the list of flatmates who are not on vacation."""
+        """Get the list of flatmates who are not on vacation.
+
+        The list is cached until the flatmates change, so callers must not modify it.
+        """
+        cached = self._active_flatmates_cache
+        if cached is not None and cached[0] == self._flatmates_version:
+            return cached[1]
+
         logger.debug("Getting list of active flatmates (not on vacation)")
         flatmates = self.get_flatmates()
         active_flatmates = [f for f in flatmates if not f.get("on_vacation", False)]
         logger.debug(f"Found {len(active_flatmates)} active flatmates out of {len(flatmates)} total")
+        active_names = tuple(f["name"] for f in active_flatmates)
+        self._active_flatmates_cache = (self._flatmates_version, active_flatmates, active_names)
         return active_flatmates
 
+    def get_active_flatmate_names(self):
+        """Get the names of the flatmates who are not on vacation, cached with get_active_flatmates."""
+        self.get_active_flatmates()
+        return self._active_flatmates_cache[2]
+
+    def _flatmate_indexes(self):
+        """Lowercased name -> flatmate and Discord ID -> flatmate maps, rebuilt when the flatmates change."""
+        cached = self._flatmate_index_cache
+        if cached is not None and cached[0] == self._flatmates_version:
+            return cached[1], cached[2]
+
+        by_name = {}
+        by_discord_id = {}
+        for flatmate in self.get_flatmates():
+            # setdefault keeps the first match, like the linear search this replaces
+            by_name.setdefault(flatmate["name"].lower(), flatmate)
+            by_discord_id.setdefault(flatmate["discord_id"], flatmate)
+        self._flatmate_index_cache = (self._flatmates_version, by_name, by_discord_id)
+        return by_name, by_discord_id
+
     def get_flatmate_by_name(self, name):
         """Get a flatmate by name."""
         logger.debug(f"Looking for flatmate with name: {name}")
-        for flatmate in self.get_flatmates():
-            if flatmate["name"].lower() == name.lower():
-                logger.debug(f"Found flatmate: {flatmate['name']} (ID: {flatmate['discord_id']})")
-                return flatmate
+        flatmate = self._flatmate_indexes()[0].get(name.lower())
+        if flatmate:
+            logger.debug(f"Found flatmate: {flatmate['name']} (ID: {flatmate['discord_id']})")
+            return flatmate
         logger.debug(f"Flatmate not found with name: {name}")
         return None
 
     def get_flatmate_by_discord_id(self, discord_id):
         """Get a flatmate by Discord ID."""
         logger.debug(f"Looking for flatmate with Discord ID: {discord_id}")
-        for flatmate in self.get_flatmates():
-            if flatmate["discord_id"] == discord_id:
-                logger.debug(f"Found flatmate: {flatmate['name']} by Discord ID: {discord_id}")
-                return flatmate
+        flatmate = self._flatmate_indexes()[1].get(discord_id)
+        if flatmate:
+            logger.debug(f"Found flatmate: {flatmate['name']} by Discord ID: {discord_id}")
+            return flatmate
         logger.debug(f"Flatmate not found with Discord ID: {discord_id}")
         return None
 
@@ -139,6 +172,7 @@ class ConfigManager:
         }
 
         self.config["flatmates"].append(new_flatmate)
+        self._flatmates_version += 1
         self.save_config()
         logger.info(f"Flatmate added successfully: {name} (ID: {discord_id})")
         return True, "Flatmate added successfully"
@@ -152,6 +186,7 @@ class ConfigManager:
             return False, "Flatmate not found"
 
         self.config["flatmates"].remove(flatmate)
+        self._flatmates_version += 1
         self.save_config()
         logger.info(f"Flatmate removed successfully: {name}")
         return True, "Flatmate removed successfully"
@@ -165,6 +200,7 @@ class ConfigManager:
             return False, "Flatmate not found"
 
         flatmate["on_vacation"] = status
+        self._flatmates_version += 1
         self.save_config()
         logger.info(f"Vacation status updated for {name}: {status}")
         return True, f"Vacation status for {name} set to {status}"
@@ -219,21 +255,25 @@ class ConfigManager:
         logger.debug(f"Stats for {name}: {flatmate['stats']}")
         return flatmate["stats"]
 
-    def add_chore(self, chore_name):
-        """Add a new chore."""
-        logger.info(f"Adding new chore: {chore_name}")
-        chores = self.get_chores()
-        if chore_name in chores:
-            logger.warning(f"Attempted to add duplicate chore: {chore_name}")
-            return False, "Chore already exists"
-
-        # Add the chore to the list
-        chores.append(chore_name)
-        self.config["chores"] = chores
-
-        self.save_config()
-        logger.info(f"Chore added successfully: {chore_name}")
-        return True, "Chore added successfully"
+    def get_all_flatmate_stats(self):
+        """Get statistics for every flatmate as a name -> stats dict, saving the config at most once."""
+        logger.debug("Getting stats for all flatmates")
+        initialized = False
+        all_stats = {}
+        for flatmate in self.get_flatmates():
+            if "stats" not in flatmate:
+                logger.debug(f"Initializing stats for {flatmate['name']}")
+                flatmate["stats"] = {
+                    "completed": 0,
+                    "reassigned": 0,
+                    "skipped": 0
+                }
+                initialized = True
+            all_stats[flatmate["name"]] = flatmate["stats"]
+
+        if initialized:
+            self.save_config()
+        return all_stats
 
     def get_posting_schedule(self):
         """Get the posting day and time."""
@@ -1,49 +1,305 @@
+import atexit
+import copy
 import datetime
+import hashlib
+import heapq
 import json
 import logging
+import mmap
 import os
+import queue
 import random
+import threading
+import time
 from pathlib import Path
 
-import discord
-
-from src.utils.strings import BotStrings
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson isn't installed
+    orjson = None
 
 logger = logging.getLogger('chores-bot')
 
+# Seconds of quiet the writer thread waits for before writing; each newer snapshot restarts the wait
+SAVE_COALESCE_DELAY = 0.5
+# Upper bound on how long a steady stream of snapshots can hold back a write
+SAVE_MAX_DELAY = 2.0
+
+# Top-level schedule keys grouped by how often they change; each group is saved to its own file
+SCHEDULE_SECTIONS = {
+    "assignments": (
+        "rotation_id", "reassign_journal_seq", "completed_journal_seq",
+        "current_assignments", "pending_chores", "completed_by",
+    ),
+    "voting": ("voted_journal_seq", "voted_flatmates", "excluded_for_next_rotation"),
+    "history": ("last_posted", "previous_assignments", "rotation_indices", "last_rotation_week"),
+}
+# Section for keys that aren't listed above
+DEFAULT_SECTION = "history"
+SECTION_FOR_KEY = {key: section for section, keys in SCHEDULE_SECTIONS.items() for key in keys}
+
+# Append-only journals and the section whose save makes their entries redundant
+JOURNAL_SECTIONS = {
+    "voted": "voting",
+    "reassign": "assignments",
+    "completed": "assignments",
+}
+# Key, stored in the journal's section, holding the sequence number of the newest entry that section contains
+JOURNAL_SEQ_KEYS = {name: f"{name}_journal_seq" for name in JOURNAL_SECTIONS}
+# Fields each journal's entries need in order to be replayed
+JOURNAL_FIELDS = {
+    "voted": {"n"},
+    "reassign": {"c", "n"},
+    "completed": {"c", "by"},
+}
+
+# Every key the schedule data is guaranteed to have after loading, with its empty value
+DEFAULT_SCHEMA = {
+    # Bumped whenever a new week starts or the schedule is reset. Journal entries are stamped with it so a
+    # crash between a rotation save and the journal checkpoint can't replay last week's entries onto the new
+    # week; it lives in the assignments section, which is written first.
+    "rotation_id": 0,
+    # Newest journal entry each section file already contains; replay only applies entries after it
+    "voted_journal_seq": 0,
+    "reassign_journal_seq": 0,
+    "completed_journal_seq": 0,
+    "last_posted": None,
+    "current_assignments": {},
+    "previous_assignments": {},  # Previous week's assignments
+    "rotation_indices": {},
+    "voted_flatmates": [],  # Flatmates who have already voted
+    "pending_chores": [],  # Chores that haven't been completed
+    "excluded_for_next_rotation": [],  # Flatmates to exclude from the next rotation
+    "last_rotation_week": {},  # When each chore was last in rotation
+    "completed_by": {}  # Who has completed each chore
+}
+
+
+class _AsyncWriter:
+    """Background thread that writes submitted snapshots, folding pending ones into the newest."""
+
+    def __init__(self, write_fn, merge_fn, delay=SAVE_COALESCE_DELAY, max_delay=SAVE_MAX_DELAY):
+        self._write_fn = write_fn
+        self._merge_fn = merge_fn
+        self._delay = delay
+        self._max_delay = max_delay
+        self._queue = queue.Queue(maxsize=1)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="schedule-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """Queue an item for writing, merging it with any item that is still pending."""
+        if self._closed:
+            self._write_fn(item)
+            return
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    pending = self._queue.get_nowait()
+                    self._queue.task_done()
+                    item = self._merge_fn(pending, item)
+                    logger.debug("Merged pending schedule snapshot into a newer one")
+                except queue.Empty:
+                    pass
+
+    def flush(self):
+        """Block until every submitted item has been written."""
+        self._queue.join()
+
+    def pending(self):
+        """Whether a submitted item is still waiting to be written."""
+        return self._queue.unfinished_tasks > 0
+
+    def close(self):
+        """Write any pending item and stop the writer thread."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            # Debounce: keep folding newer snapshots in until the burst goes quiet or the cap is hit
+            deadline = time.monotonic() + self._max_delay
+            while True:
+                timeout = min(self._delay, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                try:
+                    newer = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+                item = self._merge_fn(item, newer)
+
+            try:
+                self._write_fn(item)
+            except Exception as e:
+                logger.error(f"Failed to write schedule data: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+
+class _Journal:
+    """Append-only journal of JSON entries whose covered entries are dropped once a save has written them."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        # Sequence number of the newest entry; it only ever grows, even when a checkpoint empties the file
+        self._seq = 0
+
+    def read(self):
+        """Return every journaled line, oldest first."""
+        if not os.path.exists(self.path):
+            return []
+
+        with self._lock:
+            with open(self.path, 'rb') as f:
+                content = f.read()
+            if content and not content.endswith(b"\n"):
+                # A crash tore the last append; drop it so the next entry doesn't get glued onto it
+                keep = content.rfind(b"\n") + 1
+                logger.warning(f"Dropping torn last entry of journal {self.path}: {content[keep:]!r}")
+                content = content[:keep]
+                os.truncate(self.path, keep)
+            lines = [line for line in content.decode('utf-8', errors='replace').split("\n") if line.strip()]
+            # Keep numbering after the entries already on disk
+            self._seq = max([self._seq, *map(self._entry_seq, lines)])
+        return lines
+
+    def append(self, entry):
+        """Number an entry dict and append it to the journal."""
+        with self._lock:
+            seq = self._seq + 1
+            entry["s"] = seq
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._seq = seq
+
+    def advance(self, seq):
+        """Make sure new entries are numbered after `seq`, e.g. one a section file says it already contains."""
+        with self._lock:
+            self._seq = max(self._seq, seq)
+
+    def last_seq(self):
+        """Sequence number of the newest entry; a snapshot taken now covers every entry up to it."""
+        with self._lock:
+            return self._seq
+
+    def checkpoint(self, covered):
+        """Drop the entries numbered up to `covered` once they have been written to the data files."""
+        with self._lock:
+            if not os.path.exists(self.path):
+                return
+
+            with open(self.path, 'rb') as f:
+                lines = f.readlines()
+            # Entries appended after the snapshot was taken have higher numbers and are kept
+            remaining = [line for line in lines if self._entry_seq(line) > covered]
+            if len(remaining) == len(lines):
+                return
+            # Rewrite through a temp file so a crash can't leave the journal half-written
+            ScheduleManager._atomic_write(self.path, b"".join(remaining))
+
+    @staticmethod
+    def _entry_seq(line):
+        """Sequence number of a raw journal line; 0 for unnumbered (older or unreadable) entries."""
+        try:
+            entry = (orjson.loads if orjson is not None else json.loads)(line)
+        except ValueError:
+            return 0
+        seq = entry.get("s") if isinstance(entry, dict) else None
+        return seq if isinstance(seq, int) else 0
+
 
 class ScheduleManager:
+    # Every instance attribute has to be listed here
+    __slots__ = (
+        "config_manager", "data_file", "schedule_data",
+        "_journals", "_section_files", "_section_hashes", "_section_mtimes", "_legacy_file_pending",
+        "_rng", "_writer", "_batch_depth", "_batched_sections",
+        "_assignee_chores",
+    )
+
     def __init__(self, config_manager):
         logger.info("Initializing ScheduleManager")
         self.config_manager = config_manager
         self.data_file = self.config_manager.get_schedule_data_file()
         logger.debug(f"Schedule data file: {self.data_file}")
+        # Section files and journals all live next to the data file; create its directory once up front
+        Path(os.path.dirname(self.data_file)).mkdir(parents=True, exist_ok=True)
+        # Append-only journals of votes and reassignments, folded into the section files on save
+        self._journals = {name: _Journal(f"{self.data_file}.{name}") for name in JOURNAL_SECTIONS}
+        # One file per schedule section, plus the digest of each section's last written payload
+        self._section_files = {section: self._section_file(section) for section in SCHEDULE_SECTIONS}
+        self._section_hashes = {}
+        # mtime of each section file as of our last read or write, to spot edits made by other processes
+        self._section_mtimes = {}
+        # Set when loading from the old single-file layout, cleared once every section is written
+        self._legacy_file_pending = False
+        # Own RNG for reassignments; CHORES_BOT_RANDOM_SEED makes the picks reproducible
+        self._rng = random.Random(os.environ.get("CHORES_BOT_RANDOM_SEED"))
+        # Saves are serialized and written by a background thread
+        self._writer = _AsyncWriter(self._write_snapshot, self._merge_snapshots)
+        # The writer is a daemon thread, so write out whatever is still queued when the process exits
+        atexit.register(self.close)
+        # Inside `with schedule_manager:` blocks, saves only record their sections until the block exits
+        self._batch_depth = 0
+        self._batched_sections = set()
         self.schedule_data = self._load_schedule_data()
+        self._rebuild_indexes()
         logger.debug("ScheduleManager initialized successfully")
 
     def _load_schedule_data(self):
         """Load schedule data from the data file."""
         logger.info(f"Loading schedule data from: {self.data_file}")
         try:
-            if os.path.exists(self.data_file):
-                logger.debug("Schedule data file exists, loading data")
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(
-                        f"Schedule data loaded successfully. Current assignments: {len(data.get('current_assignments', {}))}")
-                    return data
+            existing_sections = [s for s, path in self._section_files.items() if os.path.exists(path)]
+            if existing_sections:
+                logger.debug(f"Loading schedule sections: {existing_sections}")
+                # Record every mtime before parsing: if a section fails to load, _check_reload must not
+                # keep reloading (and falling back to default data) on every call until the file changes
+                for section in existing_sections:
+                    self._section_mtimes[section] = os.stat(self._section_files[section]).st_mtime_ns
+                data = {}
+                for section in existing_sections:
+                    section_file = self._section_files[section]
+                    section_data = self._read_data_file(section_file)
+                    self._section_hashes[section] = self._payload_hash(self._serialize(section_data))
+                    data.update(section_data)
+                self._apply_schema(data)
+                self._replay_journals(data)
+                logger.info(
+                    f"Schedule data loaded successfully. Current assignments: {len(data['current_assignments'])}")
+                return data
+            elif os.path.exists(self.data_file):
+                logger.info(f"Migrating single-file schedule data to per-section files: {self.data_file}")
+                data = self._read_data_file(self.data_file)
+                self._apply_schema(data)
+                self._replay_journals(data)
+                self._legacy_file_pending = True
+                self._save_schedule_data(data)
+                logger.info(
+                    f"Schedule data loaded successfully. Current assignments: {len(data['current_assignments'])}")
+                return data
             else:
                 logger.info(f"Schedule data file not found, creating new file with default data: {self.data_file}")
                 # Initialize with empty data
-                default_data = {
-                    "last_posted": None,
-                    "current_assignments": {},
-                    "previous_assignments": {},  # Add storage for previous week's assignments
-                    "rotation_indices": {},
-                    "voted_flatmates": [],  # Track flatmates who have already voted
-                    "pending_chores": [],  # Track chores that haven't been completed
-                    "excluded_for_next_rotation": []  # Track flatmates to exclude from the next rotation
-                }
+                default_data = self._initialize_default_data()
+                self._replay_journals(default_data)
                 self._save_schedule_data(default_data)
                 return default_data
         except json.JSONDecodeError as e:
@@ -55,143 +311,408 @@ class ScheduleManager:
             # Initialize with empty data on error
             return self._initialize_default_data()
 
+    def _check_reload(self):
+        """Reload the schedule if another process has changed a section file since we last read or wrote it."""
+        if self._batch_depth or self._writer.pending():
+            # Our own unsaved changes win; the next save overwrites the external edit anyway
+            return
+
+        for section, section_file in self._section_files.items():
+            try:
+                mtime = os.stat(section_file).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if mtime != self._section_mtimes.get(section):
+                break
+        else:
+            return
+
+        logger.info("Schedule data files changed on disk, reloading")
+        self._section_mtimes = {}
+        self._section_hashes = {}
+        self.schedule_data = self._load_schedule_data()
+        self._rebuild_indexes()
+
+    def _section_file(self, section):
+        """Path of the file holding one schedule section, e.g. schedule_data.voting.json."""
+        root, ext = os.path.splitext(self.data_file)
+        return f"{root}.{section}{ext or '.json'}"
+
+    @staticmethod
+    def _read_data_file(path):
+        """Parse a schedule file with orjson when available, else with the stdlib json module."""
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # Empty files can't be mapped
+                    return orjson.loads(f.read())
+            # Parse straight from the page cache instead of copying the file into a bytes object first
+            with mm, memoryview(mm) as view:
+                return orjson.loads(view)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     def _initialize_default_data(self):
         """Initialize default schedule data."""
         logger.info("Initializing default schedule data")
-        default_data = {
-            "last_posted": None,
-            "current_assignments": {},
-            "previous_assignments": {},  # Add storage for previous week's assignments
-            "rotation_indices": {},
-            "voted_flatmates": [],
-            "pending_chores": [],
-            "excluded_for_next_rotation": [],
-            "last_rotation_week": {},  # Track when each chore was last in rotation
-            "completed_by": {}  # Track who has completed each chore
+        return self._apply_schema({})
+
+    def _rebuild_indexes(self):
+        """Rebuild the in-memory indexes kept alongside the persisted schedule data.
+
+        voted_flatmates, excluded_for_next_rotation and pending_chores are held as sets in
+        memory (and written out as sorted lists), and _assignee_chores maps each assignee
+        to their current chores. Must be called whenever one of those structures is
+        replaced rather than modified in place.
+        """
+        data = self.schedule_data
+        for key in ("voted_flatmates", "excluded_for_next_rotation", "pending_chores"):
+            # Callers that replace these usually build a fresh set already; only lists from disk need converting
+            if not isinstance(data[key], set):
+                data[key] = set(data[key])
+        self._assignee_chores = {}
+        for chore, assignee in data["current_assignments"].items():
+            self._assignee_chores.setdefault(assignee, set()).add(chore)
+
+    def _set_assignment(self, chore, assignee):
+        """Assign a chore to a flatmate, keeping the assignee index in step."""
+        assignments = self.schedule_data["current_assignments"]
+        old_assignee = assignments.get(chore)
+        if old_assignee is not None:
+            self._assignee_chores.get(old_assignee, set()).discard(chore)
+        assignments[chore] = assignee
+        self._assignee_chores.setdefault(assignee, set()).add(chore)
+        return old_assignee
+
+    @staticmethod
+    def _apply_schema(data):
+        """Fill in any missing schedule keys so the rest of the class can index them directly."""
+        for key, default in DEFAULT_SCHEMA.items():
+            if key not in data:
+                data[key] = copy.deepcopy(default)
+        return data
+
+    def _save_schedule_data(self, data=None, sections=None):
+        """Queue a snapshot of the given sections (all by default) for the background writer."""
+        sections = sections or tuple(SCHEDULE_SECTIONS)
+        if self._batch_depth and data is None:
+            self._batched_sections.update(sections)
+            return True
+
+        logger.debug("Queueing schedule data save for sections: %s", sections)
+
+        source = data or self.schedule_data
+        # Journal entries are only covered by a snapshot that includes the journal's section. The section
+        # records the newest entry it covers, so replay after a crash skips entries it already contains.
+        journals_covered = {
+            name: journal.last_seq() for name, journal in self._journals.items()
+            if JOURNAL_SECTIONS[name] in sections
         }
-        return default_data
+        for name, seq in journals_covered.items():
+            source[JOURNAL_SEQ_KEYS[name]] = seq
+
+        grouped = {section: {} for section in sections}
+        for key, value in source.items():
+            section = SECTION_FOR_KEY.get(key, DEFAULT_SECTION)
+            if section in grouped:
+                grouped[section][key] = value
+
+        self._writer.submit({
+            "sections": {section: self._snapshot(values) for section, values in grouped.items()},
+            "journals_covered": journals_covered,
+        })
+        return True
+
+    @staticmethod
+    def _merge_snapshots(older, newer):
+        """Fold a pending save into a newer one so sections only in the older save aren't lost."""
+        return {
+            "sections": {**older["sections"], **newer["sections"]},
+            "journals_covered": {
+                name: max(older["journals_covered"].get(name, 0), newer["journals_covered"].get(name, 0))
+                for name in older["journals_covered"].keys() | newer["journals_covered"].keys()
+            },
+        }
+
+    @staticmethod
+    def _snapshot(data):
+        """Copy the containers the writer thread will serialize.
 
-    def _save_schedule_data(self, data=None):
-        """Save schedule data to the data file."""
-        logger.info(f"Saving schedule data to: {self.data_file}")
+        Mutations only replace top-level entries or touch the lists inside
+        completed_by, so copying two levels deep is enough and much cheaper
+        than a deepcopy of the whole structure.
+        """
+        snapshot = {}
+        for key, value in data.items():
+            if isinstance(value, dict):
+                snapshot[key] = {k: list(v) if isinstance(v, (list, set)) else v for k, v in value.items()}
+            elif isinstance(value, set):
+                # Sorted so an unchanged set always serializes identically
+                snapshot[key] = sorted(value)
+            elif isinstance(value, list):
+                snapshot[key] = list(value)
+            else:
+                snapshot[key] = value
+        return snapshot
+
+    def _write_snapshot(self, item):
+        """Write each section of a snapshot to its file. Runs on the writer thread."""
+        for section, data in item["sections"].items():
+            section_file = self._section_files[section]
+            payload = self._serialize(data)
+            payload_hash = self._payload_hash(payload)
+            if payload_hash == self._section_hashes.get(section):
+                logger.debug("Schedule section '%s' unchanged, skipping write", section)
+                continue
+
+            # The data directory is created once in __init__
+            logger.info(f"Saving schedule data to: {section_file}")
+            self._atomic_write(section_file, payload)
+            self._section_hashes[section] = payload_hash
+            # Remember our own write so _check_reload doesn't treat it as an external change
+            self._section_mtimes[section] = os.stat(section_file).st_mtime_ns
+            logger.info(f"Schedule data saved successfully to {section_file}")
+
+        # The section files now contain the journaled entries up to the snapshot, so drop them
+        for name, covered in item["journals_covered"].items():
+            self._journals[name].checkpoint(covered)
+
+        # Once every section has been written, the old single-file layout is no longer needed
+        if self._legacy_file_pending and len(item["sections"]) == len(SCHEDULE_SECTIONS):
+            os.remove(self.data_file)
+            self._legacy_file_pending = False
+            logger.info(f"Removed migrated single-file schedule data: {self.data_file}")
+
+    @staticmethod
+    def _atomic_write(path, payload):
+        """Write a file via a synced temporary file and a rename, so a crash never leaves it truncated."""
+        tmp_file = f"{path}.tmp.{os.getpid()}"
         try:
-            # Create parent directory if it doesn't exist
-            Path(os.path.dirname(self.data_file)).mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, path)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
 
-            # Save data
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data or self.schedule_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Schedule data saved successfully to {self.data_file}")
-            return True
+        # Persist the rename itself; not every platform lets a directory be opened for this
+        try:
+            dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    @staticmethod
+    def _serialize(data):
+        """Serialize schedule data to the UTF-8 bytes written to disk."""
+        if orjson is not None:
+            # OPT_NON_STR_KEYS matches json.dumps, which stringifies non-string keys instead of failing
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def _payload_hash(payload):
+        """Digest of a serialized payload, used to detect unchanged data."""
+        return hashlib.sha1(payload).digest()
+
+    def __enter__(self):
+        """Batch the saves of every mutation in the block into a single save on exit."""
+        if not self._batch_depth:
+            # Inside the block reloads are off, so pick up external edits before it starts
+            self._check_reload()
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batched_sections:
+            sections = tuple(s for s in SCHEDULE_SECTIONS if s in self._batched_sections)
+            self._batched_sections.clear()
+            self._save_schedule_data(sections=sections)
+        return False
+
+    def flush(self):
+        """Block until all queued saves have been written to disk."""
+        self._writer.flush()
+
+    def close(self):
+        """Write any pending save and stop the background writer."""
+        logger.info("Closing ScheduleManager, flushing pending saves")
+        self._writer.close()
+
+    def _replay_journals(self, data):
+        """Apply journaled votes, reassignments and completions on top of the loaded schedule data.
+
+        Only entries newer than the one each section file records as covered are applied. Replaying
+        a covered entry isn't harmless: an older random reassignment would undo an admin reassignment
+        that was saved to the assignments section directly. Entries stamped with an earlier rotation
+        are skipped too, since the loaded sections already belong to a newer week.
+        """
+        voted = data["voted_flatmates"]
+        logged_votes = self._journal_entries("voted", data)
+        for entry in logged_votes:
+            if entry["n"] not in voted:
+                voted.append(entry["n"])
+
+        logged_reassigns = self._journal_entries("reassign", data)
+        for entry in logged_reassigns:
+            data["current_assignments"][entry["c"]] = entry["n"]
+
+        logged_completions = self._journal_entries("completed", data)
+        for entry in logged_completions:
+            if entry["c"] in data["pending_chores"]:
+                data["pending_chores"].remove(entry["c"])
+            completers = data["completed_by"].setdefault(entry["c"], [])
+            if entry["by"] not in completers:
+                completers.append(entry["by"])
+        logger.debug(
+            f"Replayed {len(logged_votes)} voted, {len(logged_reassigns)} reassignment "
+            f"and {len(logged_completions)} completion journal entries")
+
+    def _journal_entries(self, name, data):
+        """Decode the journal entries the loaded sections don't contain yet, keeping only the current rotation's."""
+        loads = orjson.loads if orjson is not None else json.loads
+        rotation_id = data["rotation_id"]
+        covered = data[JOURNAL_SEQ_KEYS[name]]
+        journal = self._journals[name]
+        # A checkpoint may have emptied the journal; new entries must still be numbered after the covered ones
+        journal.advance(covered)
+        entries = []
+        for line in journal.read():
+            if name == "voted" and not line.startswith("{"):
+                # Votes used to be journaled as bare names, without a rotation stamp
+                entries.append({"n": line})
+                continue
+            try:
+                entry = loads(line)
+            except ValueError:
+                entry = None
+            if not isinstance(entry, dict) or not JOURNAL_FIELDS[name] <= entry.keys():
+                # One bad line must not take the rest of the schedule down with it
+                logger.warning(f"Skipping undecodable {name} journal entry: {line!r}")
+                continue
+            seq = entry.get("s")
+            if isinstance(seq, int) and seq <= covered:
+                continue  # Already written to the section file
+            if entry.get("r", rotation_id) == rotation_id:
+                entries.append(entry)
+        return entries
+
+    def _append_journal(self, name, entry):
+        """Append an entry, stamped with the current rotation, to a journal instead of rewriting its section file."""
+        entry["r"] = self.schedule_data["rotation_id"]
+        try:
+            self._journals[name].append(entry)
         except Exception as e:
-            logger.error(f"Failed to save schedule data: {e}", exc_info=True)
-            raise
+            logger.warning(f"Failed to append to {name} journal, falling back to section save: {e}")
+            self._save_schedule_data(sections=(JOURNAL_SECTIONS[name],))
+
+    def _append_reassign_log(self, chore, old_assignee, new_assignee):
+        """Journal a single reassignment; replayed on load and compacted by the next assignments save."""
+        self._append_journal("reassign", {"t": time.time(), "c": chore, "o": old_assignee, "n": new_assignee})
+
+    def _append_completion_log(self, chore, completer):
+        """Journal a single completion; replayed on load and compacted by the next assignments save."""
+        self._append_journal("completed", {"t": time.time(), "c": chore, "by": completer})
 
     def get_last_posted_date(self):
         """Get the date when the schedule was last posted."""
-        logger.debug("Getting last posted date")
-        last_posted = self.schedule_data.get("last_posted")
-        logger.debug(f"Last posted date: {last_posted}")
-        return last_posted
+        self._check_reload()
+        return self.schedule_data["last_posted"]
 
     def update_last_posted_date(self):
         """Update the last posted date to now."""
+        self._check_reload()
         logger.info("Updating last posted date to current time")
-        now = datetime.datetime.now().isoformat()
+        # Second precision is plenty for a weekly post and reads better in the status command
+        now = datetime.datetime.now().isoformat(timespec="seconds")
         self.schedule_data["last_posted"] = now
+        self.schedule_data["rotation_id"] += 1
 
         # Reset voted flatmates when posting a new schedule
-        old_voted = self.schedule_data.get("voted_flatmates", [])
-        self.schedule_data["voted_flatmates"] = []
+        old_voted = self.schedule_data["voted_flatmates"]
+        self.schedule_data["voted_flatmates"] = set()
         logger.debug(f"Reset voted flatmates: {old_voted} -> []")
 
         # Initialize pending chores with all chores
-        assignments = self.schedule_data.get("current_assignments", {})
-        self.schedule_data["pending_chores"] = list(assignments.keys())
-        logger.debug(f"Set pending chores: {self.schedule_data['pending_chores']}")
+        assignments = self.schedule_data["current_assignments"]
+        self.schedule_data["pending_chores"] = set(assignments)
+        logger.debug("Set pending chores: %s", self.schedule_data["pending_chores"])
+        self._rebuild_indexes()
 
+        # Touches every section; saving it also checkpoints the journals
         self._save_schedule_data()
         logger.info(f"Last posted date updated to: {now}")
 
     def get_current_assignments(self):
         """Get the current chore assignments."""
-        logger.debug("Getting current chore assignments")
-        assignments = self.schedule_data.get("current_assignments", {})
-        logger.debug(f"Current assignments: {assignments}")
-        return assignments
+        self._check_reload()
+        return self.schedule_data["current_assignments"]
 
     def get_previous_assignments(self):
         """Get the previous week's chore assignments."""
-        logger.debug("Getting previous chore assignments")
-        assignments = self.schedule_data.get("previous_assignments", {})
-        logger.debug(f"Previous assignments: {assignments}")
-        return assignments
+        self._check_reload()
+        return self.schedule_data["previous_assignments"]
 
     def get_pending_chores(self):
-        """Get the list of chores that haven't been completed yet."""
-        logger.debug("Getting pending chores")
-        pending = self.schedule_data.get("pending_chores", [])
-        logger.debug(f"Pending chores: {pending}")
-        return pending
+        """Get the list of chores that haven't been completed yet, in schedule order."""
+        self._check_reload()
+        # Derived from the assignments so a chore that is no longer assigned can't show up as pending
+        pending = self.schedule_data["pending_chores"]
+        return [chore for chore in self.schedule_data["current_assignments"] if chore in pending]
 
     def get_assignment_for_chore(self, chore):
         """Get the flatmate assigned to a specific chore."""
-        logger.debug(f"Getting assignment for chore: {chore}")
-        assigned_flatmate = self.schedule_data.get("current_assignments", {}).get(chore)
-        logger.debug(f"Chore '{chore}' is assigned to: {assigned_flatmate}")
-        return assigned_flatmate
+        self._check_reload()
+        return self.schedule_data["current_assignments"].get(chore)
 
     def get_rotation_index(self, chore):
         """Get the current rotation index for a chore."""
-        logger.debug(f"Getting rotation index for chore: {chore}")
-        index = self.schedule_data.get("rotation_indices", {}).get(chore, 0)
-        logger.debug(f"Rotation index for '{chore}': {index}")
-        return index
+        self._check_reload()
+        return self.schedule_data["rotation_indices"].get(chore, 0)
 
     def add_voted_flatmate(self, flatmate_name):
         """Mark a flatmate as having voted (used a reaction)."""
+        self._check_reload()
         logger.info(f"Adding flatmate to voted list: {flatmate_name}")
-        if "voted_flatmates" not in self.schedule_data:
-            logger.debug("Initializing voted_flatmates list")
-            self.schedule_data["voted_flatmates"] = []
-
-        if flatmate_name not in self.schedule_data["voted_flatmates"]:
+        voted = self.schedule_data["voted_flatmates"]
+        if flatmate_name not in voted:
             logger.debug(f"Adding {flatmate_name} to voted flatmates list")
-            self.schedule_data["voted_flatmates"].append(flatmate_name)
-            self._save_schedule_data()
+            voted.add(flatmate_name)
+            self._append_journal("voted", {"t": time.time(), "n": flatmate_name})
             logger.info(f"Flatmate {flatmate_name} added to voted list")
         else:
             logger.debug(f"Flatmate {flatmate_name} already in voted list")
 
     def get_voted_flatmates(self):
         """Get list of flatmates who have already voted."""
-        logger.debug("Getting list of voted flatmates")
-        voted = self.schedule_data.get("voted_flatmates", [])
-        logger.debug(f"Voted flatmates: {voted}")
-        return voted
+        self._check_reload()
+        return self.schedule_data["voted_flatmates"]
 
     def get_excluded_for_next_rotation(self):
         """Get the list of flatmates excluded from the next rotation."""
-        logger.debug("Getting flatmates excluded from next rotation")
-        if "excluded_for_next_rotation" not in self.schedule_data:
-            logger.debug("excluded_for_next_rotation not found, initializing empty list")
-            self.schedule_data["excluded_for_next_rotation"] = []
-
-        excluded = self.schedule_data["excluded_for_next_rotation"]
-        logger.debug(f"Excluded flatmates: {excluded}")
-        return excluded
+        self._check_reload()
+        return self.schedule_data["excluded_for_next_rotation"]
 
     def exclude_from_next_rotation(self, flatmate_name):
         """Exclude a flatmate from the next rotation."""
+        self._check_reload()
         logger.info(f"Excluding flatmate from next rotation: {flatmate_name}")
-        if "excluded_for_next_rotation" not in self.schedule_data:
-            logger.debug("excluded_for_next_rotation not found, initializing empty list")
-            self.schedule_data["excluded_for_next_rotation"] = []
-
-        if flatmate_name not in self.schedule_data["excluded_for_next_rotation"]:
+        excluded = self.schedule_data["excluded_for_next_rotation"]
+        if flatmate_name not in excluded:
             logger.debug(f"Adding {flatmate_name} to excluded list")
-            self.schedule_data["excluded_for_next_rotation"].append(flatmate_name)
-            self._save_schedule_data()
+            excluded.add(flatmate_name)
+            self._save_schedule_data(sections=("voting",))
             logger.info(f"Flatmate {flatmate_name} excluded from next rotation")
             return True
         else:
@@ -200,15 +721,13 @@ class ScheduleManager:
 
     def include_in_next_rotation(self, flatmate_name):
         """Include a previously excluded flatmate in the next rotation."""
+        self._check_reload()
         logger.info(f"Including flatmate in next rotation: {flatmate_name}")
-        if "excluded_for_next_rotation" not in self.schedule_data:
-            logger.debug("excluded_for_next_rotation not found, nothing to include")
-            return False
-
-        if flatmate_name in self.schedule_data["excluded_for_next_rotation"]:
+        excluded = self.schedule_data["excluded_for_next_rotation"]
+        if flatmate_name in excluded:
             logger.debug(f"Removing {flatmate_name} from excluded list")
-            self.schedule_data["excluded_for_next_rotation"].remove(flatmate_name)
-            self._save_schedule_data()
+            excluded.discard(flatmate_name)
+            self._save_schedule_data(sections=("voting",))
             logger.info(f"Flatmate {flatmate_name} included in next rotation")
             return True
         else:
@@ -217,51 +736,60 @@ class ScheduleManager:
 
     def clear_next_rotation_exclusions(self):
         """Clear all exclusions for the next rotation."""
+        self._check_reload()
         logger.info("Clearing all exclusions for next rotation")
-        old_excluded = self.schedule_data.get("excluded_for_next_rotation", [])
-        self.schedule_data["excluded_for_next_rotation"] = []
-        self._save_schedule_data()
+        old_excluded = self.schedule_data["excluded_for_next_rotation"]
+        if not old_excluded:
+            logger.debug("No exclusions to clear, nothing to save")
+            return True
+
+        self.schedule_data["excluded_for_next_rotation"] = set()
+        self._save_schedule_data(sections=("voting",))
         logger.info(f"Cleared exclusions: {old_excluded}")
         return True
 
     def generate_new_schedule(self):
         """Generate a new chore schedule using a priority-based system that considers completion statistics and frequency."""
+        # Batch the whole run: entering the batch checks for external edits before anything is changed,
+        # and no reload can happen halfway through and discard the schedule being built
+        with self:
+            return self._build_new_schedule()
+
+    def _build_new_schedule(self):
+        """Body of generate_new_schedule; only called inside a batch."""
         logger.info("Generating new chore schedule")
 
-        # Store current assignments as previous before generating new ones
-        current_assignments = self.get_current_assignments()
-        if current_assignments:
-            logger.debug(f"Storing current assignments as previous: {current_assignments}")
-            self.schedule_data["previous_assignments"] = current_assignments.copy()
+        # The current assignments become the previous ones; they are stored once the new schedule is built
+        current_assignments = self.schedule_data["current_assignments"]
 
         # Get previous assignments to avoid repetition
-        previous_assignments = self.get_previous_assignments()
-        logger.debug(f"Previous assignments: {previous_assignments}")
+        previous_assignments = current_assignments or self.schedule_data["previous_assignments"]
+        logger.debug("Previous assignments: %s", previous_assignments)
 
         # Create inverse mapping: flatmate -> previous chore
         previous_flatmate_chores = {}
         for chore, flatmate in previous_assignments.items():
             previous_flatmate_chores[flatmate] = chore
-        logger.debug(f"Previous flatmate -> chore mapping: {previous_flatmate_chores}")
+        logger.debug("Previous flatmate -> chore mapping: %s", previous_flatmate_chores)
 
         # Get active flatmates (not on vacation)
         all_active_flatmates = self.config_manager.get_active_flatmates()
-        logger.debug(f"Found {len(all_active_flatmates)} active flatmates (not on vacation)")
+        logger.debug("Found %s active flatmates (not on vacation)", len(all_active_flatmates))
 
         # Filter out flatmates excluded for the next rotation
-        excluded_flatmates = self.get_excluded_for_next_rotation()
-        logger.debug(f"Excluding flatmates from next rotation: {excluded_flatmates}")
+        excluded_flatmates = self.schedule_data["excluded_for_next_rotation"]
+        logger.debug("Excluding flatmates from next rotation: %s", excluded_flatmates)
 
         flatmates = [f for f in all_active_flatmates if f["name"] not in excluded_flatmates]
-        logger.debug(f"Final list of {len(flatmates)} flatmates for schedule generation")
+        logger.debug("Final list of %s flatmates for schedule generation", len(flatmates))
 
         # Get current week number (for frequency calculation)
         current_week = datetime.datetime.now().isocalendar()[1]
-        logger.debug(f"Current week number: {current_week}")
+        logger.debug("Current week number: %s", current_week)
 
         # Get full chore data
         chores_data = self.config_manager.get_chores_data()
-        logger.debug(f"Got {len(chores_data)} chores with frequency data")
+        logger.debug("Got %s chores with frequency data", len(chores_data))
 
         # Filter chores based on frequency
         eligible_chores = []
@@ -269,10 +797,6 @@ class ScheduleManager:
             chore_name = chore["name"]
             frequency = chore.get("frequency", 1)
 
-            # Initialize last rotation week if not exists
-            if "last_rotation_week" not in self.schedule_data:
-                self.schedule_data["last_rotation_week"] = {}
-
             last_week = self.schedule_data["last_rotation_week"].get(chore_name, 0)
 
             # If frequency is 1 (weekly), always include
@@ -282,54 +806,57 @@ class ScheduleManager:
                 # Update last rotation week
                 self.schedule_data["last_rotation_week"][chore_name] = current_week
 
-        logger.debug(f"Eligible chores for this week: {eligible_chores}")
+        logger.debug("Eligible chores for this week: %s", eligible_chores)
+
+        # Forget rotation history for chores that have been removed from the config
+        last_rotation_week = self.schedule_data["last_rotation_week"]
+        configured_chores = {chore["name"] for chore in chores_data}
+        if not last_rotation_week.keys() <= configured_chores:
+            self.schedule_data["last_rotation_week"] = {
+                name: week for name, week in last_rotation_week.items() if name in configured_chores
+            }
 
         if not flatmates or not eligible_chores:
             logger.warning("Cannot generate schedule: No flatmates or no eligible chores")
             return {}
 
-        # Reset 'recently_returned' flag for all flatmates
+        # Reset 'recently_returned' flag for all flatmates, only rewriting the config if one was set
+        flags_reset = False
         for flatmate in self.config_manager.get_flatmates():
             if flatmate.get("recently_returned", False):
-                logger.debug(f"Resetting 'recently_returned' flag for {flatmate['name']}")
+                logger.debug("Resetting 'recently_returned' flag for %s", flatmate['name'])
                 flatmate["recently_returned"] = False
+                flags_reset = True
+
+        if flags_reset:
+            self.config_manager.save_config()
+
+        # Read every flatmate's statistics straight from the flatmate dicts we already hold
+        # (get_flatmate_stats would look each one up by name again), then score them in a single pass
+        stats_by_name = {f["name"]: f.get("stats") or {} for f in flatmates}
+
+        # Priority formula: prioritize those who have completed fewer chores
+        # and those who have skipped more (they should take responsibility).
+        # Lower priority if they had a chore last week (to avoid repetition)
+        priority_scores = {
+            name: 100 - stats.get("completed", 0) * 10 + stats.get("skipped", 0) * 5
+                  - (15 if name in previous_flatmate_chores else 0)
+            for name, stats in stats_by_name.items()
+        }
+        logger.debug("Flatmate priority scores: %s", priority_scores)
 
-        self.config_manager.save_config()
-
-        # Calculate priority scores for each flatmate based on statistics
-        flatmate_priorities = []
-        for flatmate in flatmates:
-            name = flatmate["name"]
-            stats = self.config_manager.get_flatmate_stats(name)
-
-            # Higher priority for those who have completed fewer chores
-            completed = stats.get("completed", 0)
-            skipped = stats.get("skipped", 0)
-            reassigned = stats.get("reassigned", 0)
-
-            # Priority formula: prioritize those who have completed fewer chores
-            # and those who have skipped more (they should take responsibility)
-            priority_score = 100 - (completed * 10) + (skipped * 5)
-
-            # Lower priority if they had a chore last week (to avoid repetition)
-            if name in previous_flatmate_chores:
-                priority_score -= 15
-
-            logger.debug(
-                f"Flatmate {name} priority score: {priority_score} (completed: {completed}, skipped: {skipped})")
-            flatmate_priorities.append((flatmate, priority_score))
-
-        # Sort flatmates by priority (highest score first)
-        sorted_flatmates = [f for f, _ in sorted(flatmate_priorities, key=lambda x: x[1], reverse=True)]
-        logger.debug(f"Flatmates sorted by priority: {[f['name'] for f in sorted_flatmates]}")
+        # Sort flatmate names by priority (highest score first); only names are needed from here on
+        sorted_names = sorted(priority_scores, key=priority_scores.__getitem__, reverse=True)
+        logger.debug("Flatmates sorted by priority: %s", sorted_names)
 
         # New assignments dict
         new_assignments = {}
-        available_flatmates = list(sorted_flatmates)  # Start with all flatmates
+        # Min-heap of (priority rank, name) holding everyone still without a chore
+        available_flatmates = list(enumerate(sorted_names))  # Already in heap order
 
         # First pass: Try to assign chores avoiding last week's assignments
         for chore in eligible_chores:
-            logger.debug(f"Assigning chore: {chore}")
+            logger.debug("Assigning chore: %s", chore)
 
             # Skip if no flatmates available
             if not available_flatmates:
@@ -337,76 +864,69 @@ class ScheduleManager:
 
             # Get flatmate who had this chore last week
             previous_assignee = previous_assignments.get(chore)
-            logger.debug(f"Previous assignee for '{chore}': {previous_assignee}")
-
-            # Try to assign to someone who didn't have this chore last week
-            assigned = False
-            for flatmate in available_flatmates[:]:  # Copy to avoid modification during iteration
-                if flatmate["name"] != previous_assignee:
-                    new_assignments[chore] = flatmate["name"]
-                    available_flatmates.remove(flatmate)
-                    logger.info(f"Assigned '{chore}' to {flatmate['name']} (by priority)")
-                    assigned = True
-                    break
-
-            # If we couldn't avoid last week's assignee, just pick the highest priority available
-            if not assigned and available_flatmates:
-                flatmate = available_flatmates[0]
-                new_assignments[chore] = flatmate["name"]
-                available_flatmates.remove(flatmate)
-                logger.info(f"Assigned '{chore}' to {flatmate['name']} (only available option)")
+            logger.debug("Previous assignee for '%s': %s", chore, previous_assignee)
+
+            # Take the highest priority flatmate; if they had this chore last week, try the next one
+            # instead. Only one flatmate can be the previous assignee, so at most one entry is skipped.
+            entry = heapq.heappop(available_flatmates)
+            if entry[1] == previous_assignee and available_flatmates:
+                skipped, entry = entry, heapq.heappop(available_flatmates)
+                heapq.heappush(available_flatmates, skipped)
+
+            name = entry[1]
+            new_assignments[chore] = name
+            if name != previous_assignee:
+                logger.debug("Assigned '%s' to %s (by priority)", chore, name)
+            else:
+                # Couldn't avoid last week's assignee
+                logger.debug("Assigned '%s' to %s (only available option)", chore, name)
 
         # Handle any remaining chores (if more chores than flatmates)
         remaining_chores = [c for c in eligible_chores if c not in new_assignments]
         if remaining_chores:
-            logger.debug(f"Processing {len(remaining_chores)} remaining chores")
+            logger.debug("Processing %s remaining chores", len(remaining_chores))
 
-            # Reset available flatmates list, excluding those who already have multiple chores
-            already_assigned = {}
-            for chore, flatmate_name in new_assignments.items():
-                already_assigned[flatmate_name] = already_assigned.get(flatmate_name, 0) + 1
+            # Chores are only left over once the first pass has given every flatmate exactly one.
+            # Min-heap of (assignments, tiebreak, name): fewest assignments first. Among equal counts,
+            # the flatmate picked most recently goes first, then the rest in priority order, matching
+            # the stable re-sort this replaced (two flatmates over five chores get A, B, B, A, A).
+            available_for_extra = [(1, rank, name) for rank, name in enumerate(sorted_names)]  # Already in heap order
 
-            # Prioritize flatmates with fewest assignments
-            available_for_extra = [(f, already_assigned.get(f["name"], 0)) for f in sorted_flatmates]
-            available_for_extra.sort(key=lambda x: x[1])  # Sort by number of current assignments
-
-            for chore in remaining_chores:
-                if not available_for_extra:
-                    logger.warning(f"No flatmates available for remaining chore: {chore}")
-                    break
+            for picks, chore in enumerate(remaining_chores, start=1):
+                count, _, name = heapq.heappop(available_for_extra)
+                new_assignments[chore] = name
+                logger.debug("Assigned remaining chore '%s' to %s", chore, name)
 
-                flatmate, _ = available_for_extra[0]
-                new_assignments[chore] = flatmate["name"]
-                logger.info(f"Assigned remaining chore '{chore}' to {flatmate['name']}")
-
-                # Update assignment count and re-sort
-                for i, (f, count) in enumerate(available_for_extra):
-                    if f["name"] == flatmate["name"]:
-                        available_for_extra[i] = (f, count + 1)
-                        break
-                available_for_extra.sort(key=lambda x: x[1])
+                # Put them back with the updated count, ahead of everyone already at that count
+                heapq.heappush(available_for_extra, (count + 1, -picks, name))
 
         # Save new assignments
-        logger.info(f"Final assignments: {new_assignments}")
+        logger.info("Final assignments: %s", new_assignments)
+        if current_assignments:
+            logger.debug("Storing current assignments as previous: %s", current_assignments)
+            # No copy needed: the old dict is swapped out for new_assignments here and never mutated again
+            self.schedule_data["previous_assignments"] = current_assignments
         self.schedule_data["current_assignments"] = new_assignments
+        self.schedule_data["rotation_id"] += 1
 
         # Reset voted flatmates list for the new schedule
         logger.debug("Resetting voted flatmates list for new schedule")
-        self.schedule_data["voted_flatmates"] = []
+        self.schedule_data["voted_flatmates"] = set()
 
         # Initialize pending chores with all chores
-        logger.debug(f"Setting pending chores to all {len(new_assignments)} chores")
-        self.schedule_data["pending_chores"] = list(new_assignments.keys())
+        logger.debug("Setting pending chores to all %s chores", len(new_assignments))
+        self.schedule_data["pending_chores"] = set(new_assignments)
 
-        # Initialize completed_by tracking
+        # Start completed_by over with only this rotation's chores so it never outgrows one week
         logger.debug("Initializing completed_by tracking")
         self.schedule_data["completed_by"] = {chore: [] for chore in new_assignments.keys()}
+        self._rebuild_indexes()
 
-        # Clear exclusions after generating the schedule
-        logger.debug("Clearing exclusions after generating schedule")
-        self.clear_next_rotation_exclusions()
-
-        self._save_schedule_data()
+        # Clear exclusions after generating the schedule; its save folds into the full save below
+        with self:
+            logger.debug("Clearing exclusions after generating schedule")
+            self.clear_next_rotation_exclusions()
+            self._save_schedule_data()
         logger.info("New schedule generated and saved successfully")
 
         return new_assignments
@@ -423,250 +943,93 @@ class ScheduleManager:
         Returns:
             str or None: Name of the flatmate the chore was reassigned to, or None if reassignment failed
         """
-        logger.info(f"Randomly reassigning chore '{chore}' from {excluding_flatmate}")
+        self._check_reload()
+        logger.info("Randomly reassigning chore '%s' from %s", chore, excluding_flatmate)
 
-        # Get active flatmates
-        flatmates = self.config_manager.get_active_flatmates()
-        if not flatmates:
+        # Get active flatmate names; only the chosen name is needed, so the flatmate dicts aren't touched
+        names = self.config_manager.get_active_flatmate_names()
+        if not names:
             logger.warning("Cannot reassign: No flatmates defined")
             return None
 
         # Get current assignment
-        current_assignment = self.get_assignment_for_chore(chore)
+        current_assignment = self.schedule_data["current_assignments"].get(chore)
         if not current_assignment:
-            logger.warning(f"No current assignment found for chore: {chore}")
+            logger.warning("No current assignment found for chore: %s", chore)
             return None
 
         # Get flatmates who haven't voted this week
-        voted_flatmates = self.get_voted_flatmates()
-        logger.debug(f"Flatmates who have already voted: {voted_flatmates}")
-
-        # Eligible flatmates: not the current assignee, not on vacation, and hasn't voted yet
-        eligible_flatmates = [
-            f for f in flatmates
-            if f["name"] != excluding_flatmate and f["name"] not in voted_flatmates
-        ]
-
-        logger.debug(
-            f"Found {len(eligible_flatmates)} eligible flatmates who haven't voted yet: {[f['name'] for f in eligible_flatmates]}")
-
-        # If no eligible flatmates who haven't voted, fall back to anyone except the current assignee
-        if not eligible_flatmates:
-            logger.warning("No eligible flatmates who haven't voted yet, falling back to any available flatmate")
-            eligible_flatmates = [f for f in flatmates if f["name"] != excluding_flatmate]
-            logger.debug(
-                f"Fallback: {len(eligible_flatmates)} eligible flatmates: {[f['name'] for f in eligible_flatmates]}")
+        voted_flatmates = self.schedule_data["voted_flatmates"]
+        logger.debug("Flatmates who have already voted: %s", voted_flatmates)
+
+        # Eligible flatmates: not the current assignee, not on vacation, and hasn't voted yet.
+        # Usually most flatmates qualify, so rejection-sample a few uniform picks before building
+        # the filtered list; an accepted pick is uniform over the eligible flatmates either way.
+        next_name = None
+        for _ in range(2 * len(names)):
+            candidate = self._rng.choice(names)
+            if candidate != excluding_flatmate and candidate not in voted_flatmates:
+                next_name = candidate
+                break
 
-        if not eligible_flatmates:
-            logger.warning("No eligible flatmates for reassignment")
-            return None
+        if next_name is None:
+            # One pass with two reservoir samples: a uniform pick among flatmates who haven't voted,
+            # and one among anyone except the current assignee to fall back on
+            eligible_count = fallback_count = 0
+            fallback_name = None
+            for name in names:
+                if name == excluding_flatmate:
+                    continue
+                fallback_count += 1
+                if self._rng.randrange(fallback_count) == 0:
+                    fallback_name = name
+                if name not in voted_flatmates:
+                    eligible_count += 1
+                    if self._rng.randrange(eligible_count) == 0:
+                        next_name = name
+            logger.debug("Found %d eligible flatmates who haven't voted yet", eligible_count)
+
+            # If no eligible flatmates who haven't voted, fall back to anyone except the current assignee
+            if next_name is None:
+                logger.warning("No eligible flatmates who haven't voted yet, falling back to any available flatmate")
+                logger.debug("Fallback: %d eligible flatmates", fallback_count)
+                next_name = fallback_name
+
+            if next_name is None:
+                logger.warning("No eligible flatmates for reassignment")
+                return None
 
         # Update statistics for the original flatmate
-        logger.info(f"Updating skip statistics for {excluding_flatmate}")
+        logger.info("Updating skip statistics for %s", excluding_flatmate)
         self.config_manager.update_flatmate_stats(excluding_flatmate, "skipped")
 
-        # Randomly select a flatmate
-        next_flatmate = random.choice(eligible_flatmates)
-        logger.info(f"Randomly selected {next_flatmate['name']} for reassignment")
+        logger.info("Randomly selected %s for reassignment", next_name)
 
         # Update assignment
-        old_assignment = self.schedule_data["current_assignments"].get(chore)
-        self.schedule_data["current_assignments"][chore] = next_flatmate["name"]
-        logger.debug(f"Updated assignment for '{chore}': {old_assignment} -> {next_flatmate['name']}")
+        old_assignment = self._set_assignment(chore, next_name)
+        logger.debug("Updated assignment for '%s': %s -> %s", chore, old_assignment, next_name)
 
         # Mark the new flatmate as having "voted" (been assigned a task)
-        self.add_voted_flatmate(next_flatmate["name"])
+        self.add_voted_flatmate(next_name)
 
         # Update statistics for the new flatmate
-        logger.info(f"Updating reassignment statistics for {next_flatmate['name']}")
-        self.config_manager.update_flatmate_stats(next_flatmate["name"], "reassigned")
-
-        self._save_schedule_data()
-        logger.info(f"Chore '{chore}' successfully reassigned from {excluding_flatmate} to {next_flatmate['name']}")
+        logger.info("Updating reassignment statistics for %s", next_name)
+        self.config_manager.update_flatmate_stats(next_name, "reassigned")
 
-        return next_flatmate["name"]
+        # Both changes are journaled, so the section files are left alone until the next save covers them
+        self._append_reassign_log(chore, old_assignment, next_name)
+        logger.info("Chore '%s' successfully reassigned from %s to %s", chore, excluding_flatmate, next_name)
 
-    async def _handle_chore_reaction(self, payload):
-        """Handle reactions to chore assignment messages."""
-        logger.info(f"Handling chore reaction from user ID: {payload.user_id}, emoji: {payload.emoji}")
-
-        # Get the channel
-        channel = self.bot.get_channel(payload.channel_id)
-        if not channel:
-            logger.error(f"Channel not found: {payload.channel_id}")
-            return
-
-        # Get the message
-        try:
-            logger.debug(f"Fetching message: {payload.message_id}")
-            message = await channel.fetch_message(payload.message_id)
-            if not message:
-                logger.warning(f"Message not found: {payload.message_id}")
-                return
-        except discord.errors.NotFound:
-            logger.error(f"Message {payload.message_id} not found, possibly deleted")
-            return
-        except Exception as e:
-            logger.error(f"Failed to fetch message: {e}", exc_info=True)
-            return
-
-        # Get the user who reacted
-        user = self.bot.get_user(payload.user_id)
-        if not user:
-            logger.warning(f"User not found: {payload.user_id}")
-            return
-
-        # Get the chore and assigned flatmate from our cache
-        chore, assigned_flatmate_name = self.message_cache[payload.message_id]
-        logger.debug(f"Cached assignment: chore '{chore}' assigned to {assigned_flatmate_name}")
-
-        # Get the flatmate from the user's Discord ID
-        flatmate = self.config_manager.get_flatmate_by_discord_id(payload.user_id)
-        if not flatmate:
-            # Remove reaction if the user is not a flatmate
-            logger.warning(f"User {user.name} (ID: {payload.user_id}) is not a flatmate, removing reaction")
-            await message.remove_reaction(payload.emoji, user)
-            return
-
-        # Get the emoji configuration
-        emojis = self.config_manager.get_emoji()
-        emoji_name = str(payload.emoji)
-        logger.debug(f"Reaction emoji: {emoji_name}")
-
-        # Check if this is the assigned flatmate or someone else helping out
-        is_assigned_flatmate = flatmate["name"] == assigned_flatmate_name
-
-        # Handle the reaction based on the emoji
-        if emoji_name == emojis["completed"]:
-            if is_assigned_flatmate:
-                # Mark chore as completed by assigned flatmate
-                logger.info(f"Marking chore '{chore}' as completed by {flatmate['name']}")
-                success, message_text = self.schedule_manager.mark_chore_completed(chore, flatmate["name"])
-
-                if success:
-                    # Send completion message
-                    completion_msg = BotStrings.TASK_COMPLETED.format(
-                        mention=user.mention,
-                        chore=chore
-                    )
-                    await channel.send(completion_msg)
-                    logger.info(f"Chore '{chore}' marked as completed by {flatmate['name']}")
-
-                    # Play celebration music
-                    music_cog = self.bot.get_cog("MusicCog")
-                    if music_cog:
-                        logger.info("Triggering music celebration")
-                        await music_cog.play_celebration(channel.guild)
-                    else:
-                        logger.warning("MusicCog not found, cannot play celebration music")
-            else:
-                # Another flatmate is completing the chore for the assigned flatmate
-                logger.info(f"Flatmate {flatmate['name']} is completing chore '{chore}' for {assigned_flatmate_name}")
-
-                # Mark chore as completed
-                success, _ = self.mark_chore_completed(chore, assigned_flatmate_name,
-                                                                        helper=flatmate["name"])
-
-                if success:
-                    # Get the assigned flatmate's discord mention
-                    assigned_flatmate = self.config_manager.get_flatmate_by_name(assigned_flatmate_name)
-                    assigned_mention = f"<@{assigned_flatmate['discord_id']}>" if assigned_flatmate else assigned_flatmate_name
-
-                    # Send helper completion message
-                    helper_msg = f"✅ {user.mention} has completed the chore **{chore}** for {assigned_mention}! What a hero! 🦸"
-                    await channel.send(helper_msg)
-                    logger.info(f"Chore '{chore}' completed by {flatmate['name']} for {assigned_flatmate_name}")
-
-                    # Play celebration music
-                    music_cog = self.bot.get_cog("MusicCog")
-                    if music_cog:
-                        logger.info("Triggering music celebration")
-                        await music_cog.play_celebration(channel.guild)
-                    else:
-                        logger.warning("MusicCog not found, cannot play celebration music")
-
-        elif emoji_name == emojis["unavailable"]:
-            # Rest of your unavailable reaction handling...
-            if not is_assigned_flatmate:
-                # Only the assigned flatmate can mark as unavailable
-                logger.warning(f"User {user.name} tried to mark someone else's chore as unavailable")
-                await message.remove_reaction(payload.emoji, user)
-                await channel.send(
-                    f"{user.mention} You can only mark your own assigned chores as unavailable.",
-                    delete_after=10
-                )
-                return
-
-            # Mark the original flatmate as having voted
-            logger.info(f"Marking flatmate {flatmate['name']} as unavailable for chore '{chore}'")
-            self.add_voted_flatmate(flatmate["name"])
-
-            # Randomly reassign the chore
-            logger.debug(f"Randomly reassigning chore '{chore}' from {flatmate['name']}")
-            next_flatmate_name = self.randomly_reassign_chore(
-                chore,
-                flatmate["name"]
-            )
-
-            if next_flatmate_name:
-                # Get the next flatmate's Discord ID
-                next_flatmate = self.config_manager.get_flatmate_by_name(next_flatmate_name)
-
-                if next_flatmate:
-                    next_discord_id = next_flatmate["discord_id"]
-                    logger.debug(f"Chore reassigned to {next_flatmate_name} (ID: {next_discord_id})")
-
-                    # Send reassignment notification
-                    reassign_msg = BotStrings.TASK_REASSIGNED_FULL.format(
-                        original_mention=user.mention,
-                        chore=chore,
-                        new_mention=f"<@{next_discord_id}>"
-                    )
-                    await channel.send(reassign_msg)
-
-                    # Create a new message for the reassigned chore
-                    new_task_msg = BotStrings.TASK_ASSIGNMENT.format(
-                        mention=f"<@{next_discord_id}>",
-                        chore=chore
-                    )
-                    new_message = await channel.send(new_task_msg)
-                    logger.debug(f"Created new assignment message, ID: {new_message.id}")
-
-                    # Add reactions to the new message
-                    await new_message.add_reaction(emojis["completed"])
-                    await new_message.add_reaction(emojis["unavailable"])
-                    logger.debug(f"Added reactions to new message {new_message.id}")
-
-                    # Update our message cache
-                    self.message_cache[new_message.id] = (chore, next_flatmate_name)
-                    logger.debug(f"Cached new message ID {new_message.id} for reassigned chore")
-
-                    # Remove the old message from the cache
-                    self.message_cache.pop(payload.message_id, None)
-                    logger.debug(f"Removed old message ID {payload.message_id} from cache")
-
-                    logger.info(
-                        f"Chore '{chore}' successfully reassigned from {flatmate['name']} to {next_flatmate_name}")
-            else:
-                logger.warning(f"Failed to reassign chore '{chore}'")
-                await channel.send(BotStrings.ERR_REASSIGN_FAILED.format(chore=chore))
-        else:
-            # Remove unrelated reactions
-            logger.debug(f"Removing unrelated reaction {emoji_name} from message {payload.message_id}")
-            await message.remove_reaction(payload.emoji, user)
+        return next_name
 
     def reset_schedule(self):
         """Reset the schedule data."""
+        self._check_reload()
         logger.info("Resetting schedule data")
-        self.schedule_data = {
-            "last_posted": None,
-            "current_assignments": {},
-            "previous_assignments": {},
-            "rotation_indices": {},
-            "voted_flatmates": [],
-            "pending_chores": [],
-            "excluded_for_next_rotation": []
-        }
+        rotation_id = self.schedule_data["rotation_id"] + 1
+        self.schedule_data = self._initialize_default_data()
+        self.schedule_data["rotation_id"] = rotation_id
+        self._rebuild_indexes()
         self._save_schedule_data()
         logger.info("Schedule has been reset")
         return True, "Schedule has been reset"
@@ -675,49 +1038,48 @@ class ScheduleManager:
         """One-time fix to ensure people who completed tasks last week
         are not assigned in the next rotation.
         """
+        self._check_reload()
         logger.info("Running special one-time rotation fix")
 
         # Get current assignments
-        current_assignments = self.get_current_assignments()
+        current_assignments = self.schedule_data["current_assignments"]
         if not current_assignments:
             logger.warning("No current assignments to fix")
             return False, "No current assignments to fix"
 
         # Get the list of people who completed their tasks (not in pending chores)
-        pending_chores = self.get_pending_chores()
-        logger.debug(f"Current pending chores: {pending_chores}")
-
-        completed_flatmates = []
-        for chore, flatmate in current_assignments.items():
-            if chore not in pending_chores:
-                # If the chore is not pending, it was completed
-                logger.debug(f"Flatmate {flatmate} completed chore '{chore}'")
-                completed_flatmates.append(flatmate)
+        pending_set = self.schedule_data["pending_chores"]
+        logger.debug("Current pending chores: %s", pending_set)
 
-        logger.info(f"Flatmates who completed tasks: {completed_flatmates}")
+        # A chore that is no longer pending was completed by its assignee
+        completed_flatmates = {
+            assignee for assignee, chores in self._assignee_chores.items()
+            if not chores <= pending_set
+        }
 
-        # Get all active flatmates
-        all_active_flatmates = self.config_manager.get_active_flatmates()
+        logger.info("Flatmates who completed tasks: %s", sorted(completed_flatmates))
 
-        # Find flatmates who didn't complete tasks
-        non_completing_flatmates = [f["name"] for f in all_active_flatmates
-                                    if f["name"] not in completed_flatmates]
+        # Find active flatmates who didn't complete tasks
+        active_names = [f["name"] for f in self.config_manager.get_active_flatmates()]
+        non_completing_flatmates = [name for name in active_names if name not in completed_flatmates]
 
-        logger.info(f"Flatmates who didn't complete tasks: {non_completing_flatmates}")
+        logger.info("Flatmates who didn't complete tasks: %s", non_completing_flatmates)
 
-        if len(non_completing_flatmates) < len(self.config_manager.get_chores()):
+        chore_count = len(self.config_manager.get_chores())
+        if len(non_completing_flatmates) < chore_count:
             logger.warning("Not enough non-completing flatmates for all chores")
             return False, "Not enough flatmates who didn't complete tasks for all chores"
 
-        # Exclude everyone except the non-completing flatmates from next rotation
-        for flatmate in all_active_flatmates:
-            if flatmate["name"] not in non_completing_flatmates:
-                self.exclude_from_next_rotation(flatmate["name"])
-                logger.info(f"Excluded {flatmate['name']} from next rotation as they completed their task")
+        # Exclude everyone except the non-completing flatmates from next rotation;
+        # the voting section is written once by the save below
+        to_exclude = [name for name in active_names if name in completed_flatmates]
+        self.schedule_data["excluded_for_next_rotation"].update(to_exclude)
+        logger.info("Excluded from next rotation as they completed their task: %s", to_exclude)
 
-        # Store current assignments as previous before next generation
+        # Store current assignments as previous before next generation. This one has to be a copy:
+        # reassignments edit current_assignments in place until the next schedule is generated
         self.schedule_data["previous_assignments"] = current_assignments.copy()
-        self._save_schedule_data()
+        self._save_schedule_data(sections=("voting", "history"))
 
         logger.info("One-time rotation fix applied successfully")
         return True, f"One-time fix applied. Next rotation will only include: {', '.join(non_completing_flatmates)}"
@@ -735,33 +1097,40 @@ class ScheduleManager:
         Returns:
             bool: True if reassignment was successful, False otherwise
         """
+        self._check_reload()
         logger.info(f"Admin reassigning chore '{chore}' from {current_assignee} to {new_assignee} without penalty")
 
-        # Check if chore exists in current assignments
-        if chore not in self.schedule_data.get("current_assignments", {}):
-            logger.warning(f"Chore '{chore}' not found in current assignments")
-            return False
-
-        # Check if current assignment matches
-        if self.schedule_data["current_assignments"][chore] != current_assignee:
+        # The chore must exist and still be assigned to the expected flatmate (None means it isn't assigned)
+        existing_assignee = self.schedule_data["current_assignments"].get(chore)
+        if existing_assignee != current_assignee:
             logger.warning(
-                f"Current assignee mismatch: expected {current_assignee}, got {self.schedule_data['current_assignments'][chore]}")
+                f"Current assignee mismatch for '{chore}': expected {current_assignee}, got {existing_assignee}")
             return False
 
+        # Nothing to change or save when the chore stays with the same person
+        if new_assignee == current_assignee:
+            logger.debug(f"Chore '{chore}' already assigned to {new_assignee}, nothing to save")
+            return True
+
         # Update the assignment without updating any statistics
-        old_assignee = self.schedule_data["current_assignments"][chore]
-        self.schedule_data["current_assignments"][chore] = new_assignee
+        old_assignee = self._set_assignment(chore, new_assignee)
         logger.debug(f"Updated assignment for '{chore}': {old_assignee} -> {new_assignee}")
 
         # If the chore is in pending chores, keep it there
         # If it was already completed, it won't be in pending chores
 
-        self._save_schedule_data()
+        self._save_schedule_data(sections=("assignments",))
         logger.info(
             f"Chore '{chore}' successfully reassigned from {current_assignee} to {new_assignee} without penalty")
 
         return True
 
+    def _record_completion(self, chore, completer):
+        """Track who completed a chore, journal it and credit them in their statistics."""
+        self.schedule_data["completed_by"].setdefault(chore, []).append(completer)
+        self._append_completion_log(chore, completer)
+        self.config_manager.update_flatmate_stats(completer, "completed")
+
     def mark_chore_completed(self, chore, flatmate_name, helper=None):
         """
         Mark a chore as completed.
@@ -774,62 +1143,39 @@ class ScheduleManager:
         Returns:
             tuple: (success, message)
         """
-        logger.info(f"Marking chore '{chore}' as completed by {helper or flatmate_name}")
+        self._check_reload()
+        completer = helper or flatmate_name
+        logger.info("Marking chore '%s' as completed by %s", chore, completer)
+
+        schedule_data = self.schedule_data
+        completed_by = schedule_data["completed_by"]
 
         # Check if chore exists in current assignments
-        if chore not in self.schedule_data.get("current_assignments", {}):
-            logger.warning(f"Chore '{chore}' not found in current assignments")
+        if chore not in schedule_data["current_assignments"]:
+            logger.warning("Chore '%s' not found in current assignments", chore)
             return False, "Chore not found in current assignments"
 
         # Check if the chore is still pending
-        if chore not in self.schedule_data.get("pending_chores", []):
+        if chore not in schedule_data["pending_chores"]:
             # Allow multiple completions - check if this person has already completed it
-            completed_by = self.schedule_data.get("completed_by", {}).get(chore, [])
-            completer = helper or flatmate_name
-
-            if completer in completed_by:
-                logger.warning(f"Chore '{chore}' already marked as completed by {completer}")
+            if completer in completed_by.get(chore, ()):
+                logger.warning("Chore '%s' already marked as completed by %s", chore, completer)
                 return False, f"You've already completed this chore"
 
             # Allow another person to mark it as completed again
-            logger.info(f"Chore '{chore}' already completed, but allowing {completer} to mark it again")
-
-            # Track who completed it
-            if "completed_by" not in self.schedule_data:
-                self.schedule_data["completed_by"] = {}
-            if chore not in self.schedule_data["completed_by"]:
-                self.schedule_data["completed_by"][chore] = []
-
-            self.schedule_data["completed_by"][chore].append(completer)
+            logger.info("Chore '%s' already completed, but allowing %s to mark it again", chore, completer)
 
-            # Update statistics for the helper
-            self.config_manager.update_flatmate_stats(completer, "completed")
-
-            # Save updated data
-            self._save_schedule_data()
-            logger.info(f"Chore '{chore}' marked as completed by {completer} (additional completion)")
+            self._record_completion(chore, completer)
+            logger.info("Chore '%s' marked as completed by %s (additional completion)", chore, completer)
 
             return True, "Chore marked as completed (additional)"
 
         # First completion - remove from pending chores
-        self.schedule_data["pending_chores"].remove(chore)
-        logger.debug(f"Removed chore '{chore}' from pending chores")
-
-        # Initialize completed_by tracking if not exists
-        if "completed_by" not in self.schedule_data:
-            self.schedule_data["completed_by"] = {}
-        if chore not in self.schedule_data["completed_by"]:
-            self.schedule_data["completed_by"][chore] = []
-
-        # Track who completed it
-        completer = helper or flatmate_name
-        self.schedule_data["completed_by"][chore].append(completer)
-
-        # Update statistics for the completer
-        self.config_manager.update_flatmate_stats(completer, "completed")
+        schedule_data["pending_chores"].discard(chore)
+        logger.debug("Removed chore '%s' from pending chores", chore)
 
-        # Save updated data
-        self._save_schedule_data()
-        logger.info(f"Chore '{chore}' marked as completed successfully by {completer}")
+        # Journaled by _record_completion, so the assignments file is left alone until the next save
+        self._record_completion(chore, completer)
+        logger.info("Chore '%s' marked as completed successfully by %s", chore, completer)
 
         return True, "Chore marked as completed"
\ No newline at end of file
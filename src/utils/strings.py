@@ -82,7 +82,9 @@ class BotStrings:
     STATS_COMPLETED = "Completed: {count} chores - big up yuhself!"
     STATS_REASSIGNED = "Reassigned to: {count} chores - helpful bredrin!"
     STATS_SKIPPED = "Skipped: {count} chores - gwaan step up yuh game!"
-    STATS_COMPLETION_RATE = "Completion Rate: {rate}% - {rate > 80 ? 'Irie work!' : 'Room fi improvement!'}"
+    STATS_COMPLETION_RATE = "Completion Rate: {rate}% - {verdict}"
+    STATS_RATE_GOOD = "Irie work!"  # Shown for completion rates above 80%
+    STATS_RATE_LOW = "Room fi improvement!"
 
     # Reminders
     REMINDER_HEADER = "⏰ **Chore Reminder - Nuh Forget!** ⏰"